@@ -1,18 +1,34 @@
 """Main entry point for cmdkit CLI."""
 
+import os
 import re
-import subprocess
+import shlex
+import shutil
 import sys
-from typing import List, Optional
+from contextlib import ExitStack
+from typing import Iterable, List, Optional, Tuple
 
 import typer
-from jinja2 import Template
 from rich.console import Console
-from rich.table import Table
 
 from cmdkit import __version__
 from cmdkit.storage import load_config, save_config
 
+# Matches {{variable}} placeholders in saved commands
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+# Characters that need a shell to interpret the command
+_SHELL_METACHARS = frozenset("|&;<>$`*?()[]{}~#!\\\"'\n")
+
+# Builtins and wrappers whose effect must carry over to later commands in a
+# chain; some platforms also ship executables with these names (e.g. cd)
+_SHELL_STATE_BUILTINS = frozenset({
+    "cd", "pushd", "popd", "export", "unset", "set", "source", ".",
+    "alias", "unalias", "umask", "ulimit", "exec", "eval", "readonly", "shift",
+    "trap", "hash", "declare", "typeset", "local", "command", "builtin",
+    "read", "let", "getopts", "exit", "return", "wait",
+})
+
 # Rich console for styled output
 console = Console()
 err_console = Console(stderr=True)
@@ -37,6 +53,30 @@ def print_header(message: str) -> None:
     """Print a section header."""
     console.print(f"\n[bold]{message}[/bold]")
 
+
+def print_workflow_table(rows: Iterable[Tuple[str, dict]]) -> None:
+    """Print (name, workflow) rows as a Name/Tags/Commands table."""
+    from rich.table import Table
+    from rich.text import Text
+
+    # Cells are plain Text so Rich doesn't parse workflow content as markup
+    empty = Text("-", style="dim")
+    table = Table(show_header=True, header_style="bold", show_lines=True)
+    table.add_column("Name")
+    table.add_column("Tags")
+    table.add_column("Commands")
+    
+    for name, wf in rows:
+        tags = wf.get("tags")
+        commands = wf.get("commands")
+        table.add_row(
+            Text(name),
+            Text(", ".join(tags)) if tags else empty,
+            Text("\n".join(commands)) if commands else empty,
+        )
+    
+    console.print(table)
+
 app = typer.Typer(
     name="cmdkit",
     help="A CLI tool for managing commands.",
@@ -50,12 +90,6 @@ def version_callback(value: bool) -> None:
         console.print(f"cmdkit version [cyan]{__version__}[/cyan]")
         raise typer.Exit()
 
-def arnav(value: bool) -> None:
-    """Just to test option parsing."""
-    if value:
-        console.print("Arnav option activated.")
-        raise typer.Exit()
-
 @app.callback()
 def main(
     version: bool = typer.Option(
@@ -91,11 +125,7 @@ def save(
         raise typer.Exit(1)
     
     # Detect placeholders using {{variable}} pattern
-    placeholder_pattern = re.compile(r"\{\{(\w+)\}\}")
-    placeholders = set()
-    for cmd in commands:
-        matches = placeholder_pattern.findall(cmd)
-        placeholders.update(matches)
+    placeholders = extract_placeholders(commands)
     
     # Save workflow
     config["workflows"][name] = {
@@ -107,53 +137,60 @@ def save(
     # Print success message
     print_success(f"Saved workflow [bold]{name}[/bold] with {len(commands)} command(s).")
     if placeholders:
-        print_info(f"Detected placeholders: [cyan]{', '.join(sorted(placeholders))}[/cyan]")
-
-
-def extract_placeholders(commands: List[str]) -> set:
-    """Extract unique placeholder names from commands."""
-    pattern = re.compile(r"\{\{(\w+)\}\}")
+        print_info(f"Detected placeholders: [cyan]{', '.join(placeholders)}[/cyan]")
+
+
+def _scan_placeholders(cmd: str) -> List[Tuple[int, int, str]]:
+    """Find placeholder spans in a command as (start, end, name) tuples."""
+    # Cheap substring check skips the regex for commands without placeholders
+    if "{{" not in cmd:
+        return []
+    return [(m.start(), m.end(), m.group(1)) for m in _PLACEHOLDER_RE.finditer(cmd)]
+
+
+def _render_spans(cmd: str, spans: List[Tuple[int, int, str]], values: dict) -> str:
+    """Render a command from its pre-scanned placeholder spans."""
+    if not spans:
+        return cmd
+    parts = []
+    prev = 0
+    for start, end, name in spans:
+        parts.append(cmd[prev:start])
+        # Leave unknown placeholders untouched
+        parts.append(str(values[name]) if name in values else cmd[start:end])
+        prev = end
+    parts.append(cmd[prev:])
+    return "".join(parts)
+
+
+def extract_placeholders(commands: List[str]) -> Tuple[str, ...]:
+    """Extract unique placeholder names from commands, sorted by name."""
     placeholders = set()
     for cmd in commands:
-        matches = pattern.findall(cmd)
-        placeholders.update(matches)
-    return placeholders
-
-
-def render_commands(commands: List[str], values: dict) -> List[str]:
-    """Render commands by replacing placeholders with values using Jinja2."""
-    rendered = []
-    for cmd in commands:
-        # Convert {{var}} to Jinja2 {{ var }} syntax
-        jinja_cmd = re.sub(r"\{\{(\w+)\}\}", r"{{ \1 }}", cmd)
-        template = Template(jinja_cmd)
-        rendered.append(template.render(**values))
-    return rendered
+        placeholders.update(name for _, _, name in _scan_placeholders(cmd))
+    return tuple(sorted(placeholders))
 
 
 def collect_placeholder_values(
-    placeholders: set,
+    placeholders: Tuple[str, ...],
     cli_args: List[str],
 ) -> dict:
     """Collect placeholder values from CLI args or prompt user."""
+    # Parse CLI args (--name value format); only flags naming a placeholder
+    # take a value, and another placeholder flag is never consumed as one
+    flags = {f"--{placeholder}": placeholder for placeholder in placeholders}
     values = {}
-    
-    # Parse CLI args (--name value format)
     i = 0
     while i < len(cli_args):
-        arg = cli_args[i]
-        if arg.startswith("--"):
-            key = arg[2:]
-            if i + 1 < len(cli_args) and not cli_args[i + 1].startswith("--"):
-                values[key] = cli_args[i + 1]
-                i += 2
-            else:
-                i += 1
+        name = flags.get(cli_args[i])
+        if name is not None and i + 1 < len(cli_args) and cli_args[i + 1] not in flags:
+            values[name] = cli_args[i + 1]
+            i += 2
         else:
             i += 1
     
     # Prompt for missing placeholders
-    for placeholder in sorted(placeholders):
+    for placeholder in placeholders:
         if placeholder not in values:
             console.print(f"[dim]Enter value for[/dim] [cyan]{{{{{placeholder}}}}}[/cyan]: ", end="")
             values[placeholder] = input()
@@ -161,6 +198,74 @@ def collect_placeholder_values(
     return values
 
 
+def _direct_argv(cmd: str) -> Optional[List[str]]:
+    """Split a command into argv if it can run without a shell, else None."""
+    if os.name != "posix" or any(c in _SHELL_METACHARS for c in cmd):
+        return None
+    argv = shlex.split(cmd)
+    if not argv or "=" in argv[0]:
+        return None
+    return argv
+
+
+def _run_command(cmd: str, capture: bool = False):
+    """Run a single command and return the completed process.
+    
+    Plain commands are executed directly to skip spawning an extra
+    /bin/sh; anything using shell syntax, builtins or env assignments
+    still goes through the shell. With ``capture`` set, stdout and
+    stderr are buffered on the result as raw bytes instead of streamed,
+    and stdin is closed so concurrent commands can't compete for input.
+    """
+    import subprocess
+
+    stdin = subprocess.DEVNULL if capture else None
+    argv = _direct_argv(cmd)
+    if argv is not None:
+        try:
+            return subprocess.run(argv, capture_output=capture, stdin=stdin)
+        except (FileNotFoundError, PermissionError):
+            # Shell builtin or missing program - let the shell report it
+            pass
+    return subprocess.run(cmd, shell=True, capture_output=capture, stdin=stdin)
+
+
+def _can_split_chain(commands: List[str]) -> bool:
+    """Check whether chained commands can run one by one outside a shell.
+    
+    Every command must be plain and start with a real executable; shell
+    builtins may change state that later commands in the chain rely on.
+    """
+    for cmd in commands:
+        argv = _direct_argv(cmd)
+        if argv is None or argv[0] in _SHELL_STATE_BUILTINS or shutil.which(argv[0]) is None:
+            return False
+    return True
+
+
+def _run_chain_and(commands: List[str]) -> int:
+    """Run commands like ``cmd1 && cmd2 && ...`` and return the exit code."""
+    if not _can_split_chain(commands):
+        return _run_command(" && ".join(commands)).returncode
+    for cmd in commands:
+        returncode = _run_command(cmd).returncode
+        if returncode != 0:
+            return returncode
+    return 0
+
+
+def _run_chain_or(commands: List[str]) -> int:
+    """Run commands like ``cmd1 || cmd2 || ...`` and return the exit code."""
+    if not _can_split_chain(commands):
+        return _run_command(" || ".join(commands)).returncode
+    returncode = 0
+    for cmd in commands:
+        returncode = _run_command(cmd).returncode
+        if returncode == 0:
+            break
+    return returncode
+
+
 @app.command(
     context_settings={"allow_extra_args": True, "allow_interspersed_args": False}
 )
@@ -170,12 +275,16 @@ def run(
     dry: bool = typer.Option(False, "--dry", "--dry-run", help="Preview commands without executing"),
     stop_on_fail: bool = typer.Option(False, "--stop-on-fail", "-f", help="Stop execution on first failure (chain with &&)"),
     stop_on_success: bool = typer.Option(False, "--stop-on-success", "-s", help="Stop execution on first success (chain with ||)"),
+    parallel: int = typer.Option(1, "--parallel", "-p", min=1, help="Run up to N commands concurrently (default mode only)"),
 ) -> None:
     """Run a saved workflow with placeholder substitution."""
     # Validate mutually exclusive options
     if stop_on_fail and stop_on_success:
         print_error("Cannot use --stop-on-fail and --stop-on-success together.")
         raise typer.Exit(1)
+    if parallel > 1 and (stop_on_fail or stop_on_success):
+        print_error("--parallel cannot be combined with --stop-on-fail or --stop-on-success.")
+        raise typer.Exit(1)
     
     # Load config
     config = load_config()
@@ -188,14 +297,15 @@ def run(
     workflow = config["workflows"][workflow_name]
     commands = workflow["commands"]
     
-    # Extract placeholders
-    placeholders = extract_placeholders(commands)
+    # Scan each command once; spans are reused for rendering
+    scans = [_scan_placeholders(cmd) for cmd in commands]
+    placeholders = tuple(sorted({name for spans in scans for _, _, name in spans}))
     
     # Collect values from CLI args or prompt
     values = collect_placeholder_values(placeholders, ctx.args)
     
     # Render commands
-    rendered = render_commands(commands, values)
+    rendered = [_render_spans(cmd, spans, values) for cmd, spans in zip(commands, scans)]
     
     # Dry-run mode: just print and exit
     if dry:
@@ -204,6 +314,8 @@ def run(
             console.print(f"  [dim]Mode:[/dim] stop on first failure (&&)")
         elif stop_on_success:
             console.print(f"  [dim]Mode:[/dim] stop on first success (||)")
+        elif parallel > 1:
+            console.print(f"  [dim]Mode:[/dim] run all commands ({parallel} in parallel)")
         else:
             console.print(f"  [dim]Mode:[/dim] run all commands")
         for i, cmd in enumerate(rendered, 1):
@@ -214,34 +326,54 @@ def run(
     print_header(f"Running: {workflow_name}")
     
     if stop_on_fail:
-        # Chain with && - run as single command
+        # Chain with && - stop at the first failure
         chained = " && ".join(rendered)
         console.print(f"\n[dim]Chained (&&):[/dim] [bold]{chained}[/bold]")
-        result = subprocess.run(chained, shell=True)
-        if result.returncode != 0:
-            print_error(f"Command failed with exit code {result.returncode}")
-            raise typer.Exit(result.returncode)
+        returncode = _run_chain_and(rendered)
+        if returncode != 0:
+            print_error(f"Command failed with exit code {returncode}")
+            raise typer.Exit(returncode)
         print_success("Done")
     elif stop_on_success:
-        # Chain with || - run as single command
+        # Chain with || - stop at the first success
         chained = " || ".join(rendered)
         console.print(f"\n[dim]Chained (||):[/dim] [bold]{chained}[/bold]")
-        result = subprocess.run(chained, shell=True)
-        if result.returncode != 0:
-            print_error(f"All commands failed with exit code {result.returncode}")
-            raise typer.Exit(result.returncode)
+        returncode = _run_chain_or(rendered)
+        if returncode != 0:
+            print_error(f"All commands failed with exit code {returncode}")
+            raise typer.Exit(returncode)
         print_success("Done")
     else:
-        # Default: run all commands regardless of success/failure
-        failed = []
-        for i, cmd in enumerate(rendered, 1):
-            console.print(f"\n[dim][{i}/{len(rendered)}][/dim] [bold]{cmd}[/bold]")
-            result = subprocess.run(cmd, shell=True)
-            if result.returncode != 0:
-                print_error(f"Failed with exit code {result.returncode}")
-                failed.append((i, cmd, result.returncode))
+        # Default: run all commands regardless of success/failure. Results
+        # are produced lazily, so each header prints before its command runs
+        with ExitStack() as stack:
+            if parallel > 1:
+                # Commands are independent, so run them concurrently and
+                # replay their buffered output in command order
+                from concurrent.futures import ThreadPoolExecutor
+
+                executor = stack.enter_context(ThreadPoolExecutor(parallel))
+                results = executor.map(lambda c: _run_command(c, capture=True), rendered)
             else:
-                print_success("Done")
+                results = map(_run_command, rendered)
+            
+            failed = []
+            for i, cmd in enumerate(rendered, 1):
+                console.print(f"\n[dim][{i}/{len(rendered)}][/dim] [bold]{cmd}[/bold]")
+                result = next(results)
+                if result.stdout is not None:
+                    # Output is raw bytes; flush Rich's text stream before writing it
+                    console.file.flush()
+                    sys.stdout.buffer.write(result.stdout)
+                    sys.stdout.buffer.flush()
+                    err_console.file.flush()
+                    sys.stderr.buffer.write(result.stderr)
+                    sys.stderr.buffer.flush()
+                if result.returncode != 0:
+                    print_error(f"Failed with exit code {result.returncode}")
+                    failed.append((i, cmd, result.returncode))
+                else:
+                    print_success("Done")
         
         console.print()
         if failed:
@@ -275,20 +407,7 @@ def list_workflows(
             raise typer.Exit(0)
         workflows = filtered
     
-    # Create table
-    table = Table(show_header=True, header_style="bold", show_lines=True)
-    table.add_column("Name")
-    table.add_column("Tags")
-    table.add_column("Commands")
-    
-    for name, wf in sorted(workflows.items()):
-        tags = wf.get("tags", [])
-        tag_str = ", ".join(tags) if tags else "[dim]-[/dim]"
-        commands = wf.get("commands", [])
-        cmd_str = "\n".join(commands) if commands else "[dim]-[/dim]"
-        table.add_row(name, tag_str, cmd_str)
-    
-    console.print(table)
+    print_workflow_table(sorted(workflows.items()))
 
 
 @app.command()
@@ -363,20 +482,7 @@ def search(
     
     console.print(f"Found [bold]{len(matches)}[/bold] workflow(s) matching [cyan]{query}[/cyan]:\n")
     
-    # Create table
-    table = Table(show_header=True, header_style="bold", show_lines=True)
-    table.add_column("Name")
-    table.add_column("Tags")
-    table.add_column("Commands")
-    
-    for name, wf, score in matches:
-        tags = wf.get("tags", [])
-        tag_str = ", ".join(tags) if tags else "[dim]-[/dim]"
-        commands = wf.get("commands", [])
-        cmd_str = "\n".join(commands) if commands else "[dim]-[/dim]"
-        table.add_row(name, tag_str, cmd_str)
-    
-    console.print(table)
+    print_workflow_table((name, wf) for name, wf, _ in matches)
 
 
 if __name__ == "__main__":
@@ -1,27 +1,89 @@
 """Storage utilities for cmdkit configuration."""
 
+import copy
 import json
+import os
+import shutil
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 # Default configuration structure
 DEFAULT_CONFIG = {
     "workflows": {}
 }
 
+# Resolved config path and whether its directory exists, cached per process
+_config_path = None
+_config_dir_ensured = False
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(config: dict) -> bytes:
+    """Serialize config to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode("utf-8")
+
 
 def get_config_path() -> Path:
     """Get the path to the config file.
     
+    The path is resolved once per process and reused afterwards.
+    
     Returns:
-        Path to ~/.cmdkit/config.json
+        Path from the CMDKIT_CONFIG environment variable if set,
+        otherwise ~/.cmdkit/config.json
     """
-    return Path.home() / ".cmdkit" / "config.json"
+    global _config_path
+    if _config_path is None:
+        env_path = os.environ.get("CMDKIT_CONFIG")
+        if env_path:
+            _config_path = Path(env_path).expanduser()
+        else:
+            _config_path = Path.home() / ".cmdkit" / "config.json"
+    return _config_path
 
 
 def _ensure_config_dir() -> None:
     """Ensure the config directory exists."""
+    global _config_dir_ensured
+    if _config_dir_ensured:
+        return
     config_dir = get_config_path().parent
     config_dir.mkdir(parents=True, exist_ok=True)
+    _config_dir_ensured = True
+
+
+@lru_cache(maxsize=1)
+def _read_cached(config_path: Path, mtime_ns: int, size: int, inode: int) -> bytes:
+    """Read the raw config file.
+    
+    Cached on the file's identity and modification time so repeated
+    loads within a process skip disk I/O until the file changes. Only
+    immutable bytes are cached; every load parses its own dict.
+    
+    Args:
+        config_path: Path to the config file
+        mtime_ns: Modification time of the file
+        size: Size of the file in bytes
+        inode: Inode number, which changes when the file is replaced
+    
+    Returns:
+        File contents
+    """
+    return config_path.read_bytes()
 
 
 def load_config() -> dict:
@@ -35,40 +97,67 @@ def load_config() -> dict:
     """
     config_path = get_config_path()
     
-    # Return default if file doesn't exist
-    if not config_path.exists():
-        return DEFAULT_CONFIG.copy()
+    # Return default if file doesn't exist or can't be read
+    try:
+        st = config_path.stat()
+        content = _read_cached(config_path, st.st_mtime_ns, st.st_size, st.st_ino)
+    except OSError:
+        return copy.deepcopy(DEFAULT_CONFIG)
     
-    # Try to load and parse JSON
+    # Try to parse JSON; empty or corrupted files fail to decode
     try:
-        content = config_path.read_text()
-        if not content.strip():
-            return DEFAULT_CONFIG.copy()
-        config = json.loads(content)
-        # Validate it's a dict with expected structure
-        if not isinstance(config, dict):
-            return DEFAULT_CONFIG.copy()
-        # Ensure workflows key exists
-        if "workflows" not in config:
-            config["workflows"] = {}
-        return config
-    except (json.JSONDecodeError, OSError):
-        return DEFAULT_CONFIG.copy()
+        config = _loads(content)
+    except ValueError:
+        return copy.deepcopy(DEFAULT_CONFIG)
+    
+    # Validate it's a dict with expected structure
+    if not isinstance(config, dict):
+        return copy.deepcopy(DEFAULT_CONFIG)
+    # Ensure workflows key exists
+    config.setdefault("workflows", {})
+    return config
 
 
 def save_config(config: dict) -> None:
     """Save configuration to disk.
     
     Creates the config directory and file if they don't exist.
+    The file is written to a temporary sibling first and then renamed
+    over the original, so a crash never leaves a half-written config.
+    A symlinked config is updated at its target, keeping the link.
     
     Args:
         config: Configuration dictionary to save
     """
     _ensure_config_dir()
-    config_path = get_config_path()
+    # Replace the link target, not the symlink itself
+    config_path = get_config_path().resolve()
     
+    # Serialize first so unserializable configs fail before touching disk
+    content = _dumps(config)
+    
+    tmp_path = None
     try:
-        config_path.write_text(json.dumps(config, indent=2))
-    except OSError:
-        # Silently fail - no exceptions to CLI
-        pass
+        fd, tmp_path = tempfile.mkstemp(
+            dir=config_path.parent, prefix=f".{config_path.name}.", suffix=".tmp"
+        )
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        # Keep the original file's permissions; new files get the usual
+        # umask-based mode instead of mkstemp's 0600
+        if config_path.exists():
+            shutil.copymode(config_path, tmp_path)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, config_path)
+    except BaseException as exc:
+        # Never leave the temp file behind
+        if tmp_path is not None:
+            Path(tmp_path).unlink(missing_ok=True)
+        # Silently fail on I/O errors - no exceptions to CLI
+        if not isinstance(exc, OSError):
+            raise
+    finally:
+        _read_cached.cache_clear()